@@ -8,10 +8,12 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import AsyncGenerator, Optional
 
 from fastapi import FastAPI
 
+from tls_cert_monitor.api import create_app
 from tls_cert_monitor.cache import CacheManager
 from tls_cert_monitor.config import load_config
 from tls_cert_monitor.hot_reload import HotReloadManager
@@ -19,37 +21,61 @@ from tls_cert_monitor.logger import setup_logging
 from tls_cert_monitor.metrics import MetricsCollector
 from tls_cert_monitor.scanner import CertificateScanner
 
-# Global application state
-app_state = {
-    "config": None,
-    "scanner": None,
-    "metrics": None,
-    "cache": None,
-    "hot_reload": None,
-    "logger": None,
-}
+
+@dataclass
+class DevComponents:
+    """Components owned by the development server lifespan."""
+
+    metrics: MetricsCollector
+    cache: CacheManager
+    scanner: CertificateScanner
+    hot_reload: Optional[HotReloadManager] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Manage application lifespan with proper async initialization."""
-    logger = app_state["logger"]
+    """Build and start components inside the event loop instead of at import time."""
+    logger = logging.getLogger(__name__)
+    config = app.state.config
+    components: Optional[DevComponents] = None
     try:
         logger.info("Starting async component initialization")
 
-        # Initialize cache
-        await app_state["cache"].initialize()
-
-        # Initialize hot reload if enabled
-        if app_state["config"].hot_reload:
-            config_path = os.getenv("TLS_CONFIG")
-            app_state["hot_reload"] = HotReloadManager(
-                config=app_state["config"], scanner=app_state["scanner"], config_path=config_path
+        # Initialize components
+        metrics = MetricsCollector()
+        cache = CacheManager(config)
+        components = DevComponents(
+            metrics=metrics,
+            cache=cache,
+            scanner=CertificateScanner(config=config, cache=cache, metrics=metrics),
+        )
+        app.state.components = components
+
+        # Initialize cache first - the scanner reads from it on its first pass
+        await components.cache.initialize()
+
+        # The observer is set up in a worker thread while the first scan runs on the loop
+        startup = [components.scanner.start_scanning()]
+        if config.hot_reload:
+            components.hot_reload = HotReloadManager(
+                config=config,
+                scanner=components.scanner,
+                config_path=os.getenv("TLS_CONFIG"),
+                debounce_delay=config.hot_reload_debounce_seconds,
             )
-            await app_state["hot_reload"].start()
-
-        # Start scanner
-        await app_state["scanner"].start_scanning()
+            startup.append(components.hot_reload.start())
+        await asyncio.gather(*startup)
+
+        # Routes close over the components, so mount them once they exist
+        app.mount(
+            "/",
+            create_app(
+                scanner=components.scanner,
+                metrics=components.metrics,
+                cache=components.cache,
+                config=config,
+            ),
+        )
 
         logger.info("Development server ready")
         yield
@@ -60,21 +86,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         logger.info("Shutting down components")
 
-        # Stop hot reload
-        if app_state["hot_reload"]:
-            await app_state["hot_reload"].stop()
+        if components is not None:
+            # Stop hot reload
+            if components.hot_reload:
+                await components.hot_reload.stop()
 
-        # Stop scanner
-        if app_state["scanner"]:
-            await app_state["scanner"].stop()
+            # Stop scanner
+            await components.scanner.stop()
 
-        # Close cache
-        if app_state["cache"]:
-            await app_state["cache"].close()
+            # Close cache
+            await components.cache.close()
 
 
 def create_dev_app() -> FastAPI:
-    """Create the development FastAPI app with all components."""
+    """Create the development FastAPI app; components are built in its lifespan."""
     # Allow config path via ENV
     config_path = os.getenv("TLS_CONFIG")
 
@@ -84,28 +109,13 @@ def create_dev_app() -> FastAPI:
     # Setup logging
     setup_logging(config)
     logger = logging.getLogger(__name__)
-    logger.info("Initializing development server components")
+    logger.info("Creating development server")
     if config_path:
         logger.info(f"Using custom config: {config_path}")
 
-    # Initialize components
-    metrics = MetricsCollector()
-    cache = CacheManager(config)
-    scanner = CertificateScanner(config=config, cache=cache, metrics=metrics)
-
-    # Store in global state for lifespan management
-    app_state.update(
-        {"config": config, "scanner": scanner, "metrics": metrics, "cache": cache, "logger": logger}
-    )
-
-    # Create FastAPI app with lifespan
-    from tls_cert_monitor.api import create_app
-
-    app = create_app(
-        scanner=scanner, metrics=metrics, cache=cache, config=config, lifespan_override=lifespan
-    )
-
-    logger.info("Development server components initialized")
+    # API docs are served by the mounted application
+    app = FastAPI(lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.config = config
     return app
 
 
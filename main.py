@@ -5,23 +5,40 @@ TLS Certificate Monitor - Main Application Entry Point
 
 import asyncio
 import logging
+import os
+import platform
 import signal
 import sys
+import tempfile
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
-import uvicorn
-from fastapi import FastAPI
 
 from tls_cert_monitor import __version__
-from tls_cert_monitor.api import create_app
-from tls_cert_monitor.cache import CacheManager
-from tls_cert_monitor.config import Config, load_config
-from tls_cert_monitor.hot_reload import HotReloadManager
-from tls_cert_monitor.logger import setup_logging
-from tls_cert_monitor.metrics import MetricsCollector
-from tls_cert_monitor.scanner import CertificateScanner
+
+# Heavy dependencies are imported where they are used so --version stays fast
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from tls_cert_monitor.cache import CacheManager
+    from tls_cert_monitor.config import Config
+    from tls_cert_monitor.hot_reload import HotReloadManager
+    from tls_cert_monitor.metrics import MetricsCollector
+    from tls_cert_monitor.scanner import CertificateScanner
+
+# Nuitka temp directory resolved by the first _ensure_temp_directory() call
+_TEMP_DIR_CACHE: Optional[Path] = None
+
+
+def _import_uvloop() -> Optional[ModuleType]:
+    """Import uvloop where the event loop is chosen, keeping it off the --help path."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        return None
+    return uvloop
 
 
 class TLSCertMonitor:
@@ -36,15 +53,26 @@ class TLSCertMonitor:
         self.app: Optional[FastAPI] = None
         self.config_path = config_path
         self.dry_run = dry_run
-        self._shutdown_event = asyncio.Event()
-        # Initialize logger early to avoid AttributeError
+        # Created in run(): on Python < 3.10 an Event binds to the loop current at construction
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set in __init__ so signal and shutdown paths can always log
         self.logger = logging.getLogger(__name__)
 
     def _ensure_temp_directory(self) -> None:
-        """Ensure Nuitka temp directory exists for compiled binaries."""
-        import os  # noqa: F401
-        import platform
-        import tempfile
+        """Ensure Nuitka temp directory exists for compiled binaries.
+
+        This is a no-op when running under a regular Python interpreter.
+        """
+        global _TEMP_DIR_CACHE
+
+        # Nuitka defines __compiled__ in compiled modules; nothing to prepare otherwise
+        if "__compiled__" not in globals():
+            return
+
+        # Already resolved in this process; ONEFILE_TEMPDIR (if needed) is still set
+        if _TEMP_DIR_CACHE is not None:
+            return
 
         system = platform.system()
 
@@ -61,12 +89,13 @@ class TLSCertMonitor:
             for candidate in candidates:
                 try:
                     candidate.mkdir(parents=True, exist_ok=True)
-                    # Test write access
+                    # Test write access - os.access ignores ACLs on Windows, so write a file
                     test_file = candidate / ".write_test"
                     test_file.touch()
                     test_file.unlink()
                     # Set environment variable for Nuitka
                     os.environ["ONEFILE_TEMPDIR"] = str(candidate)
+                    _TEMP_DIR_CACHE = candidate
                     break
                 except (OSError, PermissionError):
                     continue
@@ -77,6 +106,7 @@ class TLSCertMonitor:
                 temp_dir.mkdir(parents=True, exist_ok=True)
                 # Set world-writable permissions so any user can use it
                 temp_dir.chmod(0o1777)  # Sticky bit + rwxrwxrwx
+                _TEMP_DIR_CACHE = temp_dir
             except (OSError, PermissionError):
                 # If we can't create /var/tmp/tls-cert-monitor, try fallbacks
                 fallback_candidates = [
@@ -89,17 +119,25 @@ class TLSCertMonitor:
                     try:
                         candidate.mkdir(parents=True, exist_ok=True)
                         # Test write access
-                        test_file = candidate / ".write_test"
-                        test_file.touch()
-                        test_file.unlink()
+                        if not os.access(candidate, os.W_OK):
+                            continue
                         # Override Nuitka's temp directory
                         os.environ["ONEFILE_TEMPDIR"] = str(candidate)
+                        _TEMP_DIR_CACHE = candidate
                         break
                     except (OSError, PermissionError):
                         continue
 
     async def initialize(self) -> None:
         """Initialize all application components."""
+        from tls_cert_monitor.api import create_app
+        from tls_cert_monitor.cache import CacheManager
+        from tls_cert_monitor.config import load_config
+        from tls_cert_monitor.hot_reload import HotReloadManager
+        from tls_cert_monitor.logger import setup_logging
+        from tls_cert_monitor.metrics import MetricsCollector
+        from tls_cert_monitor.scanner import CertificateScanner
+
         try:
             # Ensure Nuitka temp directory exists (for compiled binaries)
             self._ensure_temp_directory()
@@ -123,20 +161,28 @@ class TLSCertMonitor:
                 config=self.config, cache=self.cache, metrics=self.metrics
             )
 
-            # Initialize hot reload manager
-            if self.config.hot_reload:
+            # Initialize hot reload manager (a dry run exits after one scan)
+            if self.config.hot_reload and not self.dry_run:
                 self.hot_reload = HotReloadManager(
-                    config=self.config, scanner=self.scanner, config_path=self.config_path
+                    config=self.config,
+                    scanner=self.scanner,
+                    config_path=self.config_path,
+                    debounce_delay=self.config.hot_reload_debounce_seconds,
                 )
-                await self.hot_reload.start()
 
             # Create FastAPI app
             self.app = create_app(
                 scanner=self.scanner, metrics=self.metrics, cache=self.cache, config=self.config
             )
 
-            # Start initial scan
-            await self.scanner.start_scanning()
+            # Start the scan loop and file watching together - the observer is set up
+            # in a worker thread while the first scan runs on the loop.
+            # A dry run performs its single scan in run(), so the loop is not started.
+            if not self.dry_run:
+                startup = [self.scanner.start_scanning()]
+                if self.hot_reload:
+                    startup.append(self.hot_reload.start())
+                await asyncio.gather(*startup)
 
             self.logger.info("TLS Certificate Monitor initialized successfully")
 
@@ -149,8 +195,10 @@ class TLSCertMonitor:
         if not self.app:
             await self.initialize()
 
-        # At this point, config is guaranteed to be set by initialize()
-        assert self.config is not None, "Config should be initialized"
+        # initialize() sets config; check explicitly so the guard survives python -O
+        config = self.config
+        if config is None:
+            raise RuntimeError("Configuration not loaded - initialize() must succeed first")
 
         # Handle dry-run mode
         if self.dry_run:
@@ -162,69 +210,120 @@ class TLSCertMonitor:
             await self.shutdown()
             return
 
-        config_dict = {
-            "app": self.app,
-            "host": self.config.bind_address,
-            "port": self.config.port,
-            "log_level": self.config.log_level.lower(),
-            "access_log": True,
-        }
-
-        # Add TLS configuration if provided
-        if self.config.tls_cert and self.config.tls_key:
-            config_dict.update(
-                {
-                    "ssl_keyfile": self.config.tls_key,
-                    "ssl_certfile": self.config.tls_cert,
-                }
-            )
-            self.logger.info(
-                f"Starting HTTPS server on {self.config.bind_address}:{self.config.port}"
-            )
-        else:
-            self.logger.info(
-                f"Starting HTTP server on {self.config.bind_address}:{self.config.port}"
-            )
+        # Server mode needs the app built by initialize()
+        app = self.app
+        if app is None:
+            raise RuntimeError("Application not created - initialize() must succeed first")
+
+        # Only server mode needs uvicorn
+        import uvicorn
+
+        use_tls = bool(config.tls_cert and config.tls_key)
+        uvicorn_config = uvicorn.Config(
+            app=app,
+            host=config.bind_address,
+            port=config.port,
+            log_level=config.log_level.lower(),
+            # Per-request access lines cost a formatted record per request; opt-in only
+            access_log=config.access_log,
+            # Route uvicorn records through the handlers from setup_logging() instead
+            # of letting uvicorn rebuild its own dictConfig handlers and formatters
+            log_config=None,
+            # serve() runs on the loop main() already chose, so no loop= setting here.
+            # http stays "auto": httptools when installed, h11 otherwise.
+            # No websocket routes; skip loading a websocket protocol implementation
+            ws="none",
+            # Scrapers ignore Server/Date; skip building them on every response
+            server_header=False,
+            date_header=False,
+            # TLS configuration if provided
+            ssl_keyfile=config.tls_key if use_tls else None,
+            ssl_certfile=config.tls_cert if use_tls else None,
+        )
+
+        scheme = "HTTPS" if use_tls else "HTTP"
+        self.logger.info(f"Starting {scheme} server on {config.bind_address}:{config.port}")
 
         # Setup signal handlers for graceful shutdown
+        self._loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        loop_signals: List[signal.Signals] = []
+        previous_handlers: Dict[signal.Signals, Any] = {}
         for sig in [signal.SIGTERM, signal.SIGINT]:
-            signal.signal(sig, self._signal_handler)
+            try:
+                self._loop.add_signal_handler(sig, self._request_shutdown, sig)
+                loop_signals.append(sig)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler support
+                previous_handlers[sig] = signal.signal(sig, self._signal_handler)
 
-        server = uvicorn.Server(uvicorn.Config(**config_dict))  # type: ignore[arg-type]
+        server = uvicorn.Server(uvicorn_config)
 
-        # Run server with graceful shutdown
+        # Run server until it exits on its own or a shutdown signal arrives
+        serve_task = asyncio.create_task(server.serve())
+        shutdown_task = asyncio.create_task(self._shutdown_event.wait())
         try:
-            await server.serve()
-        except KeyboardInterrupt:
-            self.logger.info("Received interrupt signal")
+            await asyncio.wait({serve_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not serve_task.done():
+                server.should_exit = True
+            await serve_task
         finally:
-            await self.shutdown()
+            shutdown_task.cancel()
+            try:
+                # Keep the handlers installed until teardown has finished, so a repeated
+                # SIGINT/SIGTERM cannot kill the process before the cache is saved
+                await self.shutdown()
+            finally:
+                # Unregister handlers so they stop referencing this monitor
+                for sig in loop_signals:
+                    self._loop.remove_signal_handler(sig)
+                for sig, handler in previous_handlers.items():
+                    signal.signal(sig, handler)
 
     def _signal_handler(self, signum: int, frame: Optional[object]) -> None:
-        """Handle shutdown signals."""
-        if hasattr(self, "logger"):
-            self.logger.info(f"Received signal {signum}, initiating graceful shutdown")
-        self._shutdown_event.set()
+        """Handle shutdown signals delivered through signal.signal()."""
+        # Runs outside the event loop, so hand the request over to it
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._request_shutdown, signum)
+        else:
+            self._request_shutdown(signum)
+
+    def _request_shutdown(self, signum: int) -> None:
+        """Handle shutdown signals on the event loop."""
+        if self._shutdown_event is not None and self._shutdown_event.is_set():
+            # Repeat signals while shutting down are ignored
+            self.logger.info(f"Received signal {signum}, shutdown already in progress")
+            return
+
+        self.logger.info(f"Received signal {signum}, initiating graceful shutdown")
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
 
     async def shutdown(self) -> None:
-        """Gracefully shutdown all components."""
-        if hasattr(self, "logger"):
-            self.logger.info("Starting graceful shutdown")
+        """
+        Gracefully shutdown all components.
 
-        # Stop hot reload manager
-        if self.hot_reload:
-            await self.hot_reload.stop()
+        The teardowns are independent and each waits for its blocking part (observer
+        join, worker pool shutdown, cache file write) in a worker thread, so they overlap.
+        """
+        self.logger.info("Starting graceful shutdown")
 
-        # Stop scanner
+        # Stop components concurrently - the teardowns are independent
+        teardown = []
+        if self.hot_reload:
+            teardown.append(("hot reload", self.hot_reload.stop()))
         if self.scanner:
-            await self.scanner.stop()
-
-        # Close cache
+            teardown.append(("scanner", self.scanner.stop()))
         if self.cache:
-            await self.cache.close()
+            teardown.append(("cache", self.cache.close()))
 
-        if hasattr(self, "logger"):
-            self.logger.info("Graceful shutdown completed")
+        # One failing teardown must not abandon the others
+        results = await asyncio.gather(*(coro for _, coro in teardown), return_exceptions=True)
+        for (name, _), result in zip(teardown, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error stopping {name}: {result}")
+
+        self.logger.info("Graceful shutdown completed")
 
 
 @click.command()
@@ -256,10 +355,22 @@ def main(
         print(f"TLS Certificate Monitor v{__version__}")
         return
 
+    # Use uvloop for the whole application (scanner, cache, hot reload), not just uvicorn.
+    # Python 3.12+ takes a loop factory; older versions need the global policy.
+    # A dry run is a single scan, so it skips the uvloop import.
+    run_kwargs: Dict[str, Any] = {}
+    uvloop = None if dry_run else _import_uvloop()
+    if uvloop is not None:
+        if sys.version_info >= (3, 12):
+            run_kwargs["loop_factory"] = uvloop.new_event_loop
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         # Simple execution - Nuitka-winsvc handles service mode automatically
         monitor = TLSCertMonitor(str(config) if config else None, dry_run=dry_run)
-        asyncio.run(monitor.run())
+        # Pin debug off so PYTHONASYNCIODEBUG / -X dev cannot slow every await in production
+        asyncio.run(monitor.run(), debug=False, **run_kwargs)
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
         sys.exit(0)
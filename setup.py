@@ -7,14 +7,18 @@ from pathlib import Path
 
 from setuptools import find_packages, setup
 
+_VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+
 
 # Read requirements
 def read_requirements(filename):
     """Read requirements from file."""
     requirements_path = Path(__file__).parent / filename
     if requirements_path.exists():
-        with open(requirements_path, "r", encoding="utf-8") as f:
-            return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        # Strip each line once, then drop blanks and (possibly indented) comments
+        text = requirements_path.read_text(encoding="utf-8")
+        lines = (line.strip() for line in text.splitlines())
+        return [line for line in lines if line and not line.startswith("#")]
     return []
 
 
@@ -22,13 +26,11 @@ def read_requirements(filename):
 def read_version():
     """Read version from tls_cert_monitor/__init__.py."""
     init_path = Path(__file__).parent / "tls_cert_monitor" / "__init__.py"
-    if init_path.exists():
-        with open(init_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                return match.group(1)
-    return "0.0.0"
+    match = _VERSION_RE.search(init_path.read_text(encoding="utf-8"))
+    if not match:
+        # Fail the build instead of silently publishing version 0.0.0
+        raise RuntimeError(f"Unable to find __version__ in {init_path}")
+    return match.group(1)
 
 
 # Read long description from README
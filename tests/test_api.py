@@ -2,7 +2,26 @@
 Simplified API tests to verify basic functionality.
 """
 
-from tls_cert_monitor.api import create_app
+import warnings
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from tls_cert_monitor import api
+from tls_cert_monitor.api import METRICS_GZIP_MIN_SIZE, create_app
+from tls_cert_monitor.cache import CacheManager
+from tls_cert_monitor.config import Config
+from tls_cert_monitor.metrics import MetricsCollector
+from tls_cert_monitor.scanner import CertificateScanner
+
+# Large enough to be compressed, like a real exposition body
+METRICS_TEXT = "".join(
+    f'ssl_cert_expiration_timestamp{{common_name="host{i}.example.com"}} 1.7e+09\n'
+    for i in range(50)
+)
 
 
 class TestAPI:
@@ -23,3 +42,145 @@ class TestAPI:
         assert "metrics" in sig.parameters
         assert "cache" in sig.parameters
         assert "config" in sig.parameters
+
+    def test_create_app_no_deprecation_warnings(self):
+        """Test app creation does not use deprecated FastAPI response classes."""
+        config = MagicMock(spec=Config)
+        config.dry_run = False
+        config.enable_ip_whitelist = False
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            create_app(
+                scanner=MagicMock(spec=CertificateScanner),
+                metrics=MagicMock(spec=MetricsCollector),
+                cache=MagicMock(spec=CacheManager),
+                config=config,
+            )
+
+        deprecations = [
+            str(w.message)
+            for w in caught
+            if w.category.__name__ == "FastAPIDeprecationWarning"
+            or "ORJSONResponse" in str(w.message)
+        ]
+        assert deprecations == []
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint response handling."""
+
+    @pytest.fixture
+    def mock_config(self):
+        """Create mock config with a metrics cache TTL."""
+        config = MagicMock(spec=Config)
+        config.enable_ip_whitelist = False
+        config.dry_run = False
+        config.metrics_cache_ttl_seconds = 60
+        return config
+
+    @pytest.fixture
+    def mock_metrics(self):
+        """Create mock metrics."""
+        metrics = MagicMock(spec=MetricsCollector)
+        metrics.get_metrics.return_value = METRICS_TEXT
+        metrics.get_content_type.return_value = "text/plain; version=0.0.4; charset=utf-8"
+        return metrics
+
+    @pytest.fixture
+    def mock_scanner(self, mock_config):
+        """Create mock scanner whose scans advance the scan generation."""
+        scanner = MagicMock(spec=CertificateScanner)
+        scanner.config = mock_config
+        scanner.scan_generation = 0
+
+        async def scan_once():
+            scanner.scan_generation += 1
+            return {"total_files": 0}
+
+        scanner.scan_once = AsyncMock(side_effect=scan_once)
+        return scanner
+
+    @pytest_asyncio.fixture
+    async def client(self, mock_config, mock_scanner, mock_metrics):
+        """Create test client."""
+        cache = MagicMock(spec=CacheManager)
+
+        app = create_app(
+            scanner=mock_scanner, metrics=mock_metrics, cache=cache, config=mock_config
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
+
+    async def test_metrics_gzip(self, client):
+        """Test metrics are gzip-compressed when the client accepts it."""
+        assert len(METRICS_TEXT) >= METRICS_GZIP_MIN_SIZE
+
+        response = await client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        # httpx decompresses transparently
+        assert response.text == METRICS_TEXT
+
+    async def test_metrics_gzip_refused(self, client):
+        """Test q=0 is treated as refusing gzip."""
+        response = await client.get("/metrics", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == METRICS_TEXT
+
+    async def test_metrics_small_body_uncompressed(self, client, mock_metrics):
+        """Test bodies below the gzip threshold are sent uncompressed."""
+        mock_metrics.get_metrics.return_value = "up 1\n"
+
+        response = await client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == "up 1\n"
+
+    async def test_metrics_cached_within_ttl(self, client, mock_metrics):
+        """Test repeated scrapes within the TTL reuse the rendered body."""
+        first = await client.get("/metrics")
+        second = await client.get("/metrics")
+
+        assert first.text == second.text == METRICS_TEXT
+        assert second.headers["cache-control"] == "max-age=60"
+        mock_metrics.get_metrics.assert_called_once()
+
+    async def test_metrics_invalidated_by_scheduled_scan(self, client, mock_scanner, mock_metrics):
+        """Test a scan outside the API (scheduled or hot reload) invalidates the body."""
+        await client.get("/metrics")
+        mock_scanner.scan_generation += 1
+        await client.get("/metrics")
+
+        assert mock_metrics.get_metrics.call_count == 2
+
+    async def test_metrics_invalidated_by_scan(self, client, mock_metrics):
+        """Test a manual scan invalidates the cached body."""
+        await client.get("/metrics")
+        response = await client.get("/scan")
+        assert response.status_code == 200
+        await client.get("/metrics")
+
+        assert mock_metrics.get_metrics.call_count == 2
+
+    async def test_metrics_cache_expires(self, client, mock_metrics, monkeypatch):
+        """Test the cached body is regenerated once the TTL passes."""
+        fake_now = [1000.0]
+        monkeypatch.setattr(api, "time", SimpleNamespace(monotonic=lambda: fake_now[0]))
+
+        await client.get("/metrics")
+        fake_now[0] += 59
+        await client.get("/metrics")
+        assert mock_metrics.get_metrics.call_count == 1
+
+        fake_now[0] += 1
+        await client.get("/metrics")
+        assert mock_metrics.get_metrics.call_count == 2
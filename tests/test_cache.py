@@ -2,9 +2,6 @@
 Tests for cache management.
 """
 
-import asyncio
-import tempfile
-
 import pytest
 
 from tls_cert_monitor.cache import CacheEntry, CacheManager
@@ -24,11 +21,20 @@ class TestCacheEntry:
         assert entry.size == 100
         assert entry.access_count == 0
 
+        # Slotted entries carry no per-instance __dict__
+        assert not hasattr(entry, "__dict__")
+        assert entry.to_dict() == {
+            "value": {"test": "data"},
+            "timestamp": 1000.0,
+            "ttl": 300,
+            "size": 100,
+            "access_count": 0,
+            "last_access": 0.0,
+        }
+
     def test_cache_entry_expiration(self):
         """Test cache entry expiration check."""
-        import time
-
-        current_time = time.time()
+        current_time = 10000.0
 
         # Not expired
         entry = CacheEntry(
@@ -37,7 +43,7 @@ class TestCacheEntry:
             ttl=300,  # 5 minutes TTL
             size=10,
         )
-        assert not entry.is_expired()
+        assert not entry.is_expired(current_time)
 
         # Expired
         entry = CacheEntry(
@@ -46,6 +52,9 @@ class TestCacheEntry:
             ttl=300,  # 5 minutes TTL
             size=10,
         )
+        assert entry.is_expired(current_time)
+
+        # Without an explicit time the wall clock is used
         assert entry.is_expired()
 
     def test_access_tracking(self):
@@ -60,221 +69,282 @@ class TestCacheEntry:
         assert entry.access_count == 1
         assert entry.last_access > 0
 
+        entry.update_access(2000.0)
+
+        assert entry.access_count == 2
+        assert entry.last_access == 2000.0
+
 
 @pytest.mark.asyncio
 class TestCacheManager:
     """Test cache manager functionality."""
 
-    async def test_cache_manager_initialization(self):
+    async def test_cache_manager_initialization(self, tmp_path):
         """Test cache manager initialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
 
-            await cache.initialize()
+        await cache.initialize()
 
-            assert cache.cache_dir.exists()
-            assert cache.ttl == config.cache_ttl_seconds
+        assert cache.cache_dir.exists()
+        assert cache.ttl == config.cache_ttl_seconds
 
-            await cache.close()
+        await cache.close()
 
-    async def test_cache_set_get(self):
+    async def test_cache_set_get(self, tmp_path):
         """Test basic cache set and get operations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
+        await cache.initialize()
 
-            # Set value
-            await cache.set("test_key", {"data": "test_value"})
+        # Set value
+        await cache.set("test_key", {"data": "test_value"})
 
-            # Get value
-            result = await cache.get("test_key")
-            assert result == {"data": "test_value"}
+        # Get value
+        result = await cache.get("test_key")
+        assert result == {"data": "test_value"}
 
-            await cache.close()
+        await cache.close()
 
-    async def test_cache_expiration(self):
+    async def test_cache_expiration(self, tmp_path):
         """Test cache expiration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir, cache_ttl="1s")
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path), cache_ttl="1s")
+        fake_now = [1000.0]
+        cache = CacheManager(config, time_fn=lambda: fake_now[0])
+        await cache.initialize()
 
-            # Set value with short TTL
-            await cache.set("test_key", "test_value", ttl=1)
+        # Set value with short TTL
+        await cache.set("test_key", "test_value", ttl=1)
 
-            # Should exist immediately
-            result = await cache.get("test_key")
-            assert result == "test_value"
+        # Should exist immediately
+        result = await cache.get("test_key")
+        assert result == "test_value"
 
-            # Wait for expiration
-            await asyncio.sleep(2)
+        # Advance the clock past expiration
+        fake_now[0] += 2
 
-            # Should be expired
-            result = await cache.get("test_key")
-            assert result is None
+        # Should be expired
+        result = await cache.get("test_key")
+        assert result is None
 
-            await cache.close()
+        await cache.close()
 
-    async def test_cache_delete(self):
+    async def test_cache_delete(self, tmp_path):
         """Test cache deletion."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
+        await cache.initialize()
 
-            # Set and verify
-            await cache.set("test_key", "test_value")
-            assert await cache.get("test_key") == "test_value"
+        # Set and verify
+        await cache.set("test_key", "test_value")
+        assert await cache.get("test_key") == "test_value"
 
-            # Delete
-            deleted = await cache.delete("test_key")
-            assert deleted is True
+        # Delete
+        deleted = await cache.delete("test_key")
+        assert deleted is True
 
-            # Should be gone
-            assert await cache.get("test_key") is None
+        # Should be gone
+        assert await cache.get("test_key") is None
 
-            # Delete non-existent key
-            deleted = await cache.delete("non_existent")
-            assert deleted is False
+        # Delete non-existent key
+        deleted = await cache.delete("non_existent")
+        assert deleted is False
 
-            await cache.close()
+        await cache.close()
 
-    async def test_cache_clear(self):
+    async def test_cache_clear(self, tmp_path):
         """Test cache clear operation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
+        await cache.initialize()
 
-            # Set multiple values
-            await cache.set("key1", "value1")
-            await cache.set("key2", "value2")
-            await cache.set("key3", "value3")
+        # Set multiple values
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key3", "value3")
 
-            # Clear cache
-            await cache.clear()
+        # Clear cache
+        await cache.clear()
 
-            # All should be gone
-            assert await cache.get("key1") is None
-            assert await cache.get("key2") is None
-            assert await cache.get("key3") is None
+        # All should be gone
+        assert await cache.get("key1") is None
+        assert await cache.get("key2") is None
+        assert await cache.get("key3") is None
 
-            await cache.close()
+        await cache.close()
 
-    async def test_cache_stats(self):
+    async def test_cache_stats(self, tmp_path):
         """Test cache statistics."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
-
-            # Initial stats
-            stats = await cache.get_stats()
-            assert stats["entries_total"] == 0
-            assert stats["hit_rate"] == 0.0
-
-            # Add some entries and access them
-            await cache.set("key1", "value1")
-            await cache.set("key2", "value2")
-
-            # Hit
-            await cache.get("key1")
-            # Miss
-            await cache.get("key3")
-
-            stats = await cache.get_stats()
-            assert stats["entries_total"] == 2
-            assert stats["total_accesses"] == 2
-            assert stats["cache_hits"] == 1
-            assert stats["cache_misses"] == 1
-            assert stats["hit_rate"] == 0.5
-
-            await cache.close()
-
-    async def test_cache_cleanup_expired(self):
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
+        await cache.initialize()
+
+        # Initial stats
+        stats = await cache.get_stats()
+        assert stats["entries_total"] == 0
+        assert stats["hit_rate"] == 0.0
+
+        # Add some entries and access them
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        # Hit
+        await cache.get("key1")
+        # Miss
+        await cache.get("key3")
+
+        stats = await cache.get_stats()
+        assert stats["entries_total"] == 2
+        assert stats["total_accesses"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+        await cache.close()
+
+    async def test_cache_cleanup_expired(self, tmp_path):
         """Test cleanup of expired entries."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path))
+        fake_now = [1000.0]
+        cache = CacheManager(config, time_fn=lambda: fake_now[0])
+        await cache.initialize()
 
-            # Set entries with different TTLs
-            await cache.set("short_ttl", "value1", ttl=1)
-            await cache.set("long_ttl", "value2", ttl=300)
+        # Set entries with different TTLs
+        await cache.set("short_ttl", "value1", ttl=1)
+        await cache.set("long_ttl", "value2", ttl=300)
+        for i in range(100):
+            await cache.set(f"long_ttl_{i}", i, ttl=300)
 
-            # Wait for short TTL to expire
-            await asyncio.sleep(2)
+        # Overwriting with a long TTL leaves a stale deadline behind that must be skipped
+        await cache.set("overwritten", "old", ttl=1)
+        await cache.set("overwritten", "new", ttl=300)
 
-            # Cleanup
-            expired_count = await cache.cleanup_expired()
-            assert expired_count == 1
+        # Advance the clock past the short TTL
+        fake_now[0] += 2
 
-            # Check remaining entries
-            assert await cache.get("short_ttl") is None
-            assert await cache.get("long_ttl") == "value2"
+        # Cleanup
+        expired_count = await cache.cleanup_expired()
+        assert expired_count == 1
 
-            await cache.close()
+        # Check remaining entries
+        assert await cache.get("short_ttl") is None
+        assert await cache.get("long_ttl") == "value2"
+        assert await cache.get("overwritten") == "new"
 
-    async def test_make_key(self):
+        stats = await cache.get_stats()
+        assert stats["entries_total"] == 102
+
+        await cache.close()
+
+    async def test_make_key(self, tmp_path):
         """Test cache key generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
 
-            key1 = cache.make_key("arg1", "arg2", 123)
-            key2 = cache.make_key("arg1", "arg2", 123)
-            key3 = cache.make_key("arg1", "arg2", 456)
+        key1 = cache.make_key("arg1", "arg2", 123)
+        key2 = cache.make_key("arg1", "arg2", 123)
+        key3 = cache.make_key("arg1", "arg2", 456)
 
-            # Same arguments should produce same key
-            assert key1 == key2
+        # Same arguments should produce same key
+        assert key1 == key2
 
-            # Different arguments should produce different key
-            assert key1 != key3
+        # Different arguments should produce different key
+        assert key1 != key3
 
-            # Key should be reasonable length (full SHA256 hash)
-            assert len(key1) == 64  # Full SHA256 hash for security
+        # Key should be reasonable length (256-bit BLAKE2b hash)
+        assert len(key1) == 64  # Full 256-bit digest for security
 
-    async def test_cache_size_limits(self):
+    async def test_cache_size_limits(self, tmp_path):
         """Test cache size limit enforcement."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir, cache_max_size=1000)  # 1KB limit
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path), cache_max_size=1000)  # 1KB limit
+        cache = CacheManager(config)
+        await cache.initialize()
+
+        # Add large entries that exceed the limit
+        large_data = "x" * 400  # 400 bytes each
+
+        await cache.set("key1", large_data)
+        await cache.set("key2", large_data)
+
+        # Touch key1 so key2 becomes the least recently used entry
+        assert await cache.get("key1") == large_data
 
-            # Add large entries that exceed the limit
-            large_data = "x" * 400  # 400 bytes each
+        await cache.set("key3", large_data)  # Should trigger eviction
 
-            await cache.set("key1", large_data)
-            await cache.set("key2", large_data)
-            await cache.set("key3", large_data)  # Should trigger eviction
+        stats = await cache.get_stats()
+        assert stats["current_size_bytes"] <= config.cache_max_size
 
-            stats = await cache.get_stats()
-            assert stats["current_size_bytes"] <= config.cache_max_size
+        # key2 is evicted, the recently used key1 survives
+        assert await cache.get("key2") is None
+        assert await cache.get("key1") == large_data
+        assert await cache.get("key3") == large_data
 
-            await cache.close()
+        # A value larger than the whole cache is not admitted and evicts nothing
+        await cache.set("oversized", "x" * 2000)
+        assert await cache.get("oversized") is None
+        assert await cache.get("key1") == large_data
+        assert await cache.get("key3") == large_data
 
-    async def test_health_status(self):
+        await cache.close()
+
+    async def test_health_status(self, tmp_path):
         """Test cache health status."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(cache_dir=temp_dir)
-            cache = CacheManager(config)
-            await cache.initialize()
+        config = Config(cache_dir=str(tmp_path))
+        cache = CacheManager(config)
+        await cache.initialize()
+
+        # Add some data
+        await cache.set("test_key", "test_value")
+        await cache.get("test_key")  # Create a hit
+
+        health = await cache.get_health_status()
+
+        assert "cache_entries_total" in health
+        assert "cache_file_path" in health
+        assert "cache_file_writable" in health
+        assert "cache_hit_rate" in health
+        assert "cache_total_accesses" in health
+
+        assert health["cache_entries_total"] == 1
+        assert health["cache_total_accesses"] == 1
+
+        await cache.close()
+
+    async def test_persistent_cache_roundtrip(self, tmp_path):
+        """Test file cache entries survive a restart."""
+        config = Config(cache_dir=str(tmp_path), cache_type="file")
+        cache = CacheManager(config)
+        await cache.initialize()
+
+        await cache.set("test_key", {"common_name": "example.com"})
+        await cache.close()
+
+        # A new manager warms up from the file written on close
+        restarted = CacheManager(config)
+        await restarted.initialize()
+
+        assert await restarted.get("test_key") == {"common_name": "example.com"}
+
+        await restarted.close()
 
-            # Add some data
-            await cache.set("test_key", "test_value")
-            await cache.get("test_key")  # Create a hit
+    async def test_persistent_cache_reload_many_entries(self, tmp_path):
+        """Test a large file cache reloads completely."""
+        config = Config(cache_dir=str(tmp_path), cache_type="file")
+        cache = CacheManager(config)
+        await cache.initialize()
 
-            health = await cache.get_health_status()
+        for i in range(2000):
+            await cache.set(f"cert_{i}", {"index": i, "common_name": f"host{i}.example.com"})
+        await cache.close()
 
-            assert "cache_entries_total" in health
-            assert "cache_file_path" in health
-            assert "cache_file_writable" in health
-            assert "cache_hit_rate" in health
-            assert "cache_total_accesses" in health
+        restarted = CacheManager(config)
+        await restarted.initialize()
 
-            assert health["cache_entries_total"] == 1
-            assert health["cache_total_accesses"] == 1
+        stats = await restarted.get_stats()
+        assert stats["entries_total"] == 2000
+        assert await restarted.get("cert_1999") == {
+            "index": 1999,
+            "common_name": "host1999.example.com",
+        }
 
-            await cache.close()
+        await restarted.close()
@@ -2,10 +2,6 @@
 Tests for configuration management.
 """
 
-import os
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
@@ -26,22 +22,34 @@ class TestConfig:
         assert config.scan_interval == "5m"
         assert config.hot_reload is True
         assert config.dry_run is False
+        assert config.access_log is False
         assert config.enable_ip_whitelist is True
         assert "127.0.0.1" in config.allowed_ips
         assert "::1" in config.allowed_ips
 
     def test_duration_parsing(self):
         """Test duration parsing."""
-        config = Config(scan_interval="10m", cache_ttl="2h")
+        config = Config(
+            scan_interval="10m", cache_ttl="2h", metrics_cache_ttl="0s", hot_reload_debounce="5s"
+        )
 
         assert config.scan_interval_seconds == 600  # 10 minutes
         assert config.cache_ttl_seconds == 7200  # 2 hours
+        assert config.metrics_cache_ttl_seconds == 0  # disabled
+        assert config.hot_reload_debounce_seconds == 5
+        assert Config().hot_reload_debounce_seconds == 2  # default
 
     def test_invalid_duration(self):
         """Test invalid duration format."""
         with pytest.raises(ValueError):
             Config(scan_interval="invalid")
 
+        # Direct parsing rejects bad input every time, not only on first call
+        config = Config()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                config.parse_duration_seconds("5 minutes")
+
     def test_invalid_log_level(self):
         """Test invalid log level."""
         with pytest.raises(ValueError):
@@ -59,7 +67,7 @@ class TestConfig:
 class TestLoadConfig:
     """Test configuration loading."""
 
-    def test_load_from_file(self):
+    def test_load_from_file(self, tmp_path):
         """Test loading configuration from YAML file."""
         config_data = {
             "port": 8080,
@@ -68,19 +76,16 @@ class TestLoadConfig:
             "workers": 8,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
             yaml.dump(config_data, f)
-            config_path = f.name
 
-        try:
-            config = load_config(config_path)
+        config = load_config(str(config_path))
 
-            assert config.port == 8080
-            assert config.bind_address == "127.0.0.1"
-            assert config.certificate_directories == ["/test/path"]
-            assert config.workers == 8
-        finally:
-            os.unlink(config_path)
+        assert config.port == 8080
+        assert config.bind_address == "127.0.0.1"
+        assert config.certificate_directories == ["/test/path"]
+        assert config.workers == 8
 
     def test_load_nonexistent_file(self):
         """Test loading from nonexistent file."""
@@ -92,56 +97,49 @@ class TestLoadConfig:
         config = load_config()
         assert config.port == 3200  # Default value
 
-    def test_environment_variable_override(self):
+    def test_environment_variable_override(self, monkeypatch):
         """Test environment variable overrides."""
-        os.environ["TLS_MONITOR_PORT"] = "9090"
-        os.environ["TLS_MONITOR_LOG_LEVEL"] = "DEBUG"
-
-        try:
-            config = load_config()
-            assert config.port == 9090
-            assert config.log_level == "DEBUG"
-        finally:
-            del os.environ["TLS_MONITOR_PORT"]
-            del os.environ["TLS_MONITOR_LOG_LEVEL"]
-
-    def test_environment_list_variables(self):
+        monkeypatch.setenv("TLS_MONITOR_PORT", "9090")
+        monkeypatch.setenv("TLS_MONITOR_LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("TLS_MONITOR_ACCESS_LOG", "true")
+
+        config = load_config()
+        assert config.port == 9090
+        assert config.log_level == "DEBUG"
+        assert config.access_log is True
+
+    def test_environment_list_variables(self, monkeypatch):
         """Test environment variables for lists."""
-        os.environ["TLS_MONITOR_CERT_DIRECTORIES"] = "/path1,/path2,/path3"
-        os.environ["TLS_MONITOR_P12_PASSWORDS"] = "pass1,pass2,pass3"
+        monkeypatch.setenv("TLS_MONITOR_CERT_DIRECTORIES", "/path1,/path2,/path3")
+        monkeypatch.setenv("TLS_MONITOR_P12_PASSWORDS", "pass1,pass2,pass3")
 
-        try:
-            config = load_config()
-            assert config.certificate_directories == ["/path1", "/path2", "/path3"]
-            assert config.p12_passwords == ["pass1", "pass2", "pass3"]
-        finally:
-            del os.environ["TLS_MONITOR_CERT_DIRECTORIES"]
-            del os.environ["TLS_MONITOR_P12_PASSWORDS"]
+        config = load_config()
+        assert config.certificate_directories == ["/path1", "/path2", "/path3"]
+        assert config.p12_passwords == ["pass1", "pass2", "pass3"]
 
 
 class TestCreateExampleConfig:
     """Test example configuration creation."""
 
-    def test_create_example_config(self):
+    def test_create_example_config(self, tmp_path):
         """Test creating example configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            example_path = Path(temp_dir) / "example.yaml"
-            create_example_config(str(example_path))
-
-            assert example_path.exists()
-
-            # Load and validate the example config
-            with open(example_path, "r") as f:
-                config_data = yaml.safe_load(f)
-
-            assert "port" in config_data
-            assert "certificate_directories" in config_data
-            assert "p12_passwords" in config_data
-            assert "allowed_ips" in config_data
-            assert "enable_ip_whitelist" in config_data
-
-            # Should be valid configuration
-            config = Config(**config_data)
-            assert config.port == 3200
-            assert config.enable_ip_whitelist is True
-            assert "127.0.0.1" in config.allowed_ips
+        example_path = tmp_path / "example.yaml"
+        create_example_config(str(example_path))
+
+        assert example_path.exists()
+
+        # Load and validate the example config
+        with open(example_path, "r") as f:
+            config_data = yaml.safe_load(f)
+
+        assert "port" in config_data
+        assert "certificate_directories" in config_data
+        assert "p12_passwords" in config_data
+        assert "allowed_ips" in config_data
+        assert "enable_ip_whitelist" in config_data
+
+        # Should be valid configuration
+        config = Config(**config_data)
+        assert config.port == 3200
+        assert config.enable_ip_whitelist is True
+        assert "127.0.0.1" in config.allowed_ips
@@ -2,6 +2,7 @@
 Tests for hot reload functionality.
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -56,7 +57,9 @@ async def hot_reload_manager(temp_config_file, temp_cert_dir):
     metrics = MetricsCollector()
     scanner = CertificateScanner(config=config, cache=cache, metrics=metrics)
 
-    manager = HotReloadManager(config=config, scanner=scanner, config_path=temp_config_file)
+    manager = HotReloadManager(
+        config=config, scanner=scanner, config_path=temp_config_file, debounce_delay=0.1
+    )
 
     yield manager
 
@@ -346,6 +349,33 @@ class TestHotReloadManager:
         # Verify re-scan was triggered
         hot_reload_manager.scanner.scan_once.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_certificate_change_replaces_pending_task(self, hot_reload_manager):
+        """Test that a new event for the same file cancels the pending debounced task."""
+
+        async def slow_cert_change(*_):
+            await asyncio.sleep(10)
+
+        hot_reload_manager._debounced_cert_change = slow_cert_change
+        test_file = str(Path(hot_reload_manager.config.certificate_directories[0]) / "test.pem")
+
+        await hot_reload_manager._handle_certificate_change(test_file, "created")
+        first_task = hot_reload_manager._cert_change_tasks[test_file]
+        await hot_reload_manager._handle_certificate_change(test_file, "modified")
+        second_task = hot_reload_manager._cert_change_tasks[test_file]
+
+        assert first_task is not second_task
+        assert len(hot_reload_manager._cert_change_tasks) == 1
+
+        # The replaced task must not evict the new one when it finishes
+        await asyncio.gather(first_task, return_exceptions=True)
+        assert first_task.cancelled()
+        assert hot_reload_manager._cert_change_tasks[test_file] is second_task
+
+        second_task.cancel()
+        await asyncio.gather(second_task, return_exceptions=True)
+        assert test_file not in hot_reload_manager._cert_change_tasks
+
     @pytest.mark.asyncio
     async def test_get_status(self, hot_reload_manager):
         """Test getting hot reload status."""
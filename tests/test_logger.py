@@ -0,0 +1,90 @@
+"""
+Tests for logging configuration.
+"""
+
+import json
+import logging
+import logging.handlers
+
+import pytest
+
+from tls_cert_monitor.config import Config
+from tls_cert_monitor.logger import _ListenerState, get_logger, setup_logging, stop_logging
+
+
+@pytest.fixture
+def root_logger():
+    """Detach the root handlers for the test and restore them afterwards."""
+    logger = logging.getLogger()
+    saved_handlers = logger.handlers[:]
+    saved_level = logger.level
+    logger.handlers.clear()
+
+    yield logger
+
+    # Tear down whatever setup_logging() installed
+    stop_logging()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+    logger.handlers[:] = saved_handlers
+    logger.setLevel(saved_level)
+
+
+def read_records(log_file):
+    """Read structured records written by the test logger."""
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    return [r for r in records if r["logger"] == "tls_cert_monitor.test"]
+
+
+class TestSetupLogging:
+    """Test logging through the background queue listener."""
+
+    def test_exception_reaches_structured_log(self, root_logger, tmp_path):
+        """Test tracebacks keep their own field in structured file logs."""
+        log_file = tmp_path / "monitor.log"
+        setup_logging(Config(log_file=str(log_file)))
+        logger = get_logger("test")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Scan failed")
+
+        # Stopping the listener flushes queued records to the file
+        stop_logging()
+
+        record = read_records(log_file)[0]
+        assert record["message"] == "Scan failed"
+        assert "exception" in record
+        assert "ValueError: boom" in record["exception"]
+
+    def test_message_args_merged_at_call_time(self, root_logger, tmp_path):
+        """Test queued records show arguments as they were when logged."""
+        log_file = tmp_path / "monitor.log"
+        setup_logging(Config(log_file=str(log_file)))
+        logger = get_logger("test")
+
+        paths = ["a.pem"]
+        logger.info("Scanning %s", paths)
+        paths.append("b.pem")
+
+        stop_logging()
+
+        assert read_records(log_file)[0]["message"] == "Scanning ['a.pem']"
+
+    def test_stop_logging_closes_file_handler(self, root_logger, tmp_path):
+        """Test stopping and re-running setup does not leak the log file handle."""
+        setup_logging(Config(log_file=str(tmp_path / "first.log")))
+        listener = _ListenerState.listener
+        assert listener is not None
+        file_handlers = [
+            h for h in listener.handlers if isinstance(h, logging.handlers.RotatingFileHandler)
+        ]
+        assert len(file_handlers) == 1
+
+        setup_logging(Config(log_file=str(tmp_path / "second.log")))
+
+        # The first listener's file handler was closed when it was replaced
+        assert file_handlers[0].stream is None
+        assert len(root_logger.handlers) == 1
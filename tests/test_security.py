@@ -6,8 +6,9 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
 from tls_cert_monitor.api import create_app
 from tls_cert_monitor.cache import CacheManager
@@ -147,19 +148,21 @@ class TestIPWhitelistingMiddleware:
         metrics.get_content_type.return_value = "text/plain; charset=utf-8"
         return metrics
 
-    @pytest.fixture
-    def client(self, mock_config, mock_scanner, mock_cache, mock_metrics):
+    @pytest_asyncio.fixture
+    async def client(self, mock_config, mock_scanner, mock_cache, mock_metrics):
         """Create test client with IP whitelisting enabled."""
         app = create_app(
             config=mock_config, scanner=mock_scanner, cache=mock_cache, metrics=mock_metrics
         )
-        return TestClient(app)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
 
     def test_middleware_functionality_basic(
         self, mock_config, mock_scanner, mock_cache, mock_metrics
     ):
         """Test basic middleware functionality with mocked request."""
-        # Test the middleware logic directly rather than through TestClient
+        # Test the middleware logic directly rather than through a client
         app = create_app(
             config=mock_config, scanner=mock_scanner, cache=mock_cache, metrics=mock_metrics
         )
@@ -169,7 +172,7 @@ class TestIPWhitelistingMiddleware:
         # Just verify that middleware was added (exact structure varies by FastAPI version)
         assert hasattr(app, "middleware")
 
-    def test_ip_whitelist_disabled_allows_all(self):
+    async def test_ip_whitelist_disabled_allows_all(self):
         """Test that disabling IP whitelist allows all requests."""
         config = MagicMock(spec=Config)
         config.enable_ip_whitelist = False
@@ -182,9 +185,10 @@ class TestIPWhitelistingMiddleware:
         metrics.get_content_type.return_value = "text/plain; charset=utf-8"
 
         app = create_app(config=config, scanner=scanner, cache=cache, metrics=metrics)
-        client = TestClient(app)
+        transport = httpx.ASGITransport(app=app)
 
-        response = client.get("/healthz")
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.get("/healthz")
         # Should not be blocked due to IP (may still fail due to mock issues)
         assert response.status_code in [200, 500]
 
@@ -210,8 +214,8 @@ class TestConfigurationEndpointSecurity:
         config.enable_ip_whitelist = False  # Disable for testing
         return config
 
-    @pytest.fixture
-    def client(self, mock_config):
+    @pytest_asyncio.fixture
+    async def client(self, mock_config):
         """Create test client."""
         scanner = MagicMock(spec=CertificateScanner)
         scanner.config = mock_config
@@ -220,11 +224,13 @@ class TestConfigurationEndpointSecurity:
         metrics = MagicMock(spec=MetricsCollector)
 
         app = create_app(config=mock_config, scanner=scanner, cache=cache, metrics=metrics)
-        return TestClient(app)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
 
-    def test_sensitive_data_redacted_in_config_endpoint(self, client):
+    async def test_sensitive_data_redacted_in_config_endpoint(self, client):
         """Test that sensitive data is redacted in /config endpoint."""
-        response = client.get("/config")
+        response = await client.get("/config")
         assert response.status_code == 200
 
         config_data = response.json()
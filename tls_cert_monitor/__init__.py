@@ -9,12 +9,34 @@ __version__ = "1.0.7"
 __author__ = "TLS Certificate Monitor Team"
 __description__ = "Cross-platform TLS certificate monitoring application"
 
-from tls_cert_monitor.config import Config
-from tls_cert_monitor.metrics import MetricsCollector
-from tls_cert_monitor.scanner import CertificateScanner
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tls_cert_monitor.config import Config
+    from tls_cert_monitor.metrics import MetricsCollector
+    from tls_cert_monitor.scanner import CertificateScanner
 
 __all__ = [
     "Config",
     "CertificateScanner",
     "MetricsCollector",
 ]
+
+# Exports are resolved on first access so reading __version__ (e.g. for
+# --version) does not pull in pydantic, prometheus_client and cryptography
+_LAZY_EXPORTS = {
+    "Config": "tls_cert_monitor.config",
+    "CertificateScanner": "tls_cert_monitor.scanner",
+    "MetricsCollector": "tls_cert_monitor.metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes lazily on first attribute access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -3,13 +3,17 @@ FastAPI application for TLS Certificate Monitor.
 """
 
 import asyncio
+import gzip
 import html
 import ipaddress
 import os
 import shutil
+import time
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional, Union
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse
@@ -22,6 +26,63 @@ from tls_cert_monitor.metrics import MetricsCollector
 from tls_cert_monitor.scanner import CertificateScanner
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content straight to UTF-8 bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Smaller /metrics bodies are sent uncompressed; gzip overhead outweighs the savings
+METRICS_GZIP_MIN_SIZE = 500
+
+
+class _MetricsBodyCache:
+    """Rendered /metrics body reused between scrapes."""
+
+    __slots__ = ("body", "gzip_body", "expires_at", "scan_generation")
+
+    def __init__(self) -> None:
+        self.body: Optional[bytes] = None
+        self.gzip_body: Optional[bytes] = None
+        self.expires_at = 0.0
+        # Scanner generation the body was rendered from
+        self.scan_generation = -1
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    gzip_q: Optional[float] = None
+    wildcard_q: Optional[float] = None
+
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+
+        # Codings default to q=1; q=0 means the client refuses it
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if coding == "gzip":
+            gzip_q = q
+        else:
+            wildcard_q = q
+
+    # An explicit gzip entry takes precedence over the wildcard
+    if gzip_q is None:
+        gzip_q = wildcard_q
+    return gzip_q is not None and gzip_q > 0
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan handler for startup and shutdown events."""
@@ -47,7 +108,6 @@ def create_app(
     metrics: MetricsCollector,
     cache: CacheManager,
     config: Config,
-    lifespan_override: Optional[Any] = None,
 ) -> FastAPI:
     """
     Create and configure FastAPI application.
@@ -67,7 +127,8 @@ def create_app(
         version=__version__,
         docs_url="/docs" if not config.dry_run else None,
         redoc_url="/redoc" if not config.dry_run else None,
-        lifespan=lifespan_override or lifespan,
+        lifespan=lifespan,
+        default_response_class=OrjsonResponse,
     )
 
     app.add_middleware(
@@ -120,7 +181,7 @@ def create_app(
 
         if not is_allowed:
             logger.warning(f"Access denied for IP address: {client_ip}")
-            return JSONResponse(
+            return OrjsonResponse(
                 status_code=403,
                 content={
                     "error": "Access forbidden",
@@ -134,17 +195,51 @@ def create_app(
         response = await call_next(request)
         return response
 
+    # Rendered /metrics body, reused for metrics_cache_ttl so bursts of scrapes
+    # render the exposition text once. Any completed scan (scheduled, hot reload
+    # or manual /scan) invalidates it. The gzip variant is compressed on first
+    # request and cached alongside.
+    metrics_cache = _MetricsBodyCache()
+
     @app.get("/metrics", response_class=PlainTextResponse)
-    async def get_metrics() -> PlainTextResponse:
+    async def get_metrics(request: Request) -> Response:
         try:
-            metrics_data: str = metrics.get_metrics()
-            return PlainTextResponse(content=metrics_data, media_type=metrics.get_content_type())
+            ttl = scanner.config.metrics_cache_ttl_seconds
+            now = time.monotonic()
+            generation = scanner.scan_generation
+            metrics_data = metrics_cache.body
+            if (
+                metrics_data is None
+                or now >= metrics_cache.expires_at
+                or generation != metrics_cache.scan_generation
+            ):
+                metrics_data = metrics.get_metrics().encode("utf-8")
+                metrics_cache.body = metrics_data
+                metrics_cache.gzip_body = None
+                metrics_cache.expires_at = now + ttl
+                metrics_cache.scan_generation = generation
+
+            headers = {"Vary": "Accept-Encoding"}
+            if ttl > 0:
+                headers["Cache-Control"] = f"max-age={ttl}"
+
+            # Prometheus sends Accept-Encoding: gzip; the exposition text compresses ~10x
+            accept_encoding = request.headers.get("accept-encoding", "")
+            if len(metrics_data) >= METRICS_GZIP_MIN_SIZE and _accepts_gzip(accept_encoding):
+                if metrics_cache.gzip_body is None:
+                    metrics_cache.gzip_body = gzip.compress(metrics_data, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+                metrics_data = metrics_cache.gzip_body
+
+            return Response(
+                content=metrics_data, media_type=metrics.get_content_type(), headers=headers
+            )
         except Exception as e:
             logger.error(f"Failed to generate metrics: {e}")
             raise HTTPException(status_code=500, detail="Failed to generate metrics") from e
 
-    @app.get("/healthz", response_class=JSONResponse)
-    async def get_health() -> JSONResponse:
+    @app.get("/healthz", response_class=OrjsonResponse)
+    async def get_health() -> OrjsonResponse:
         try:
             scanner_health = await scanner.get_health_status()
             cache_health = await cache.get_health_status()
@@ -160,27 +255,27 @@ def create_app(
                 "version": __version__,
             }
 
-            return JSONResponse(content=health_status)
+            return OrjsonResponse(content=health_status)
         except Exception as e:
             logger.error(f"Failed to get health status: {e}")
-            return JSONResponse(content={"status": "error", "error": str(e)}, status_code=500)
+            return OrjsonResponse(content={"status": "error", "error": str(e)}, status_code=500)
 
-    @app.get("/scan", response_class=JSONResponse)
-    async def trigger_scan() -> JSONResponse:
+    @app.get("/scan", response_class=OrjsonResponse)
+    async def trigger_scan() -> OrjsonResponse:
         if scanner.config.dry_run:
-            return JSONResponse(
+            return OrjsonResponse(
                 content={"message": "Scan not performed - dry run mode enabled"}, status_code=200
             )
         try:
             logger.info("Manual scan triggered via API")
             scan_results = await scanner.scan_once()
-            return JSONResponse(content=scan_results)
+            return OrjsonResponse(content=scan_results)
         except Exception as e:
             logger.error(f"Manual scan failed: {e}")
             raise HTTPException(status_code=500, detail=f"Scan failed: {e}") from e
 
-    @app.get("/config", response_class=JSONResponse)
-    async def get_config() -> JSONResponse:
+    @app.get("/config", response_class=OrjsonResponse)
+    async def get_config() -> OrjsonResponse:
         try:
             # Use current config from scanner (updated by hot reload)
             current_config = scanner.config
@@ -204,35 +299,33 @@ def create_app(
                 masked_dirs = []
                 for dir_path in config_dict["certificate_directories"]:
                     # Show only the basename, not full paths
-                    from pathlib import Path
-
                     masked_dirs.append(f"***/{Path(dir_path).name}")
                 config_dict["certificate_directories"] = masked_dirs
 
-            return JSONResponse(content=config_dict)
+            return OrjsonResponse(content=config_dict)
         except Exception as e:
             logger.error(f"Failed to get configuration: {e}")
             raise HTTPException(status_code=500, detail="Failed to get configuration") from e
 
-    @app.get("/cache/stats", response_class=JSONResponse)
-    async def get_cache_stats() -> JSONResponse:
+    @app.get("/cache/stats", response_class=OrjsonResponse)
+    async def get_cache_stats() -> OrjsonResponse:
         try:
             stats = await cache.get_stats()
-            return JSONResponse(content=stats)
+            return OrjsonResponse(content=stats)
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
             raise HTTPException(status_code=500, detail="Failed to get cache stats") from e
 
-    @app.post("/cache/clear", response_class=JSONResponse)
-    async def clear_cache() -> JSONResponse:
+    @app.post("/cache/clear", response_class=OrjsonResponse)
+    async def clear_cache() -> OrjsonResponse:
         if scanner.config.dry_run:
-            return JSONResponse(
+            return OrjsonResponse(
                 content={"message": "Cache not cleared - dry run mode enabled"}, status_code=200
             )
         try:
             await cache.clear()
             logger.info("Cache cleared via API")
-            return JSONResponse(content={"message": "Cache cleared successfully"})
+            return OrjsonResponse(content={"message": "Cache cleared successfully"})
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
             raise HTTPException(status_code=500, detail="Failed to clear cache") from e
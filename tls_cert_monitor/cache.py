@@ -4,12 +4,16 @@ Cache management for TLS Certificate Monitor.
 
 import asyncio
 import hashlib
+import heapq
 import json
 import os
+import platform
 import time
-from dataclasses import asdict, dataclass
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 from tls_cert_monitor.config import Config
 from tls_cert_monitor.logger import get_logger, log_cache_operation
@@ -20,25 +24,42 @@ def bytes_to_mib(bytes_value: int) -> float:
     return bytes_value / (1024 * 1024)
 
 
-@dataclass
 class CacheEntry:
     """Cache entry with metadata."""
 
-    value: Any
-    timestamp: float
-    ttl: int
-    size: int
-    access_count: int = 0
-    last_access: float = 0.0
-
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired."""
-        return time.time() - self.timestamp > self.ttl
-
-    def update_access(self) -> None:
+    # Hand-slotted rather than a dataclass - dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("value", "timestamp", "ttl", "size", "access_count", "last_access")
+
+    def __init__(
+        self,
+        value: Any,
+        timestamp: float,
+        ttl: int,
+        size: int,
+        access_count: int = 0,
+        last_access: float = 0.0,
+    ):
+        self.value = value
+        self.timestamp = timestamp
+        self.ttl = ttl
+        self.size = size
+        self.access_count = access_count
+        self.last_access = last_access
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entry to a dictionary for persistence."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if cache entry is expired, optionally against a precomputed time."""
+        if now is None:
+            now = time.time()
+        return now - self.timestamp > self.ttl
+
+    def update_access(self, now: Optional[float] = None) -> None:
         """Update access statistics."""
         self.access_count += 1
-        self.last_access = time.time()
+        self.last_access = time.time() if now is None else now
 
 
 class CacheManager:
@@ -48,7 +69,7 @@ class CacheManager:
     Provides both in-memory and persistent caching with LRU eviction.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, time_fn: Callable[[], float] = time.time):
         self.config = config
         self.logger = get_logger("cache")
         self.cache_type = config.cache_type
@@ -57,8 +78,13 @@ class CacheManager:
         self.ttl = config.cache_ttl_seconds
         self.max_size = config.cache_max_size
 
-        # In-memory cache
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        # Wall-clock source for entry timestamps; injectable so tests need not sleep
+        self._now = time_fn
+
+        # In-memory cache, kept in LRU order (least recently used first)
+        self._memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Min-heap of (expires_at, key); stale items are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._current_size = 0
         self._access_count = 0
         self._hit_count = 0
@@ -95,14 +121,16 @@ class CacheManager:
                 return None
 
             entry = self._memory_cache[key]
+            now = self._now()
 
-            if entry.is_expired():
+            if entry.is_expired(now):
                 del self._memory_cache[key]
                 self._current_size -= entry.size
                 log_cache_operation(self.logger, "miss", key)
                 return None
 
-            entry.update_access()
+            entry.update_access(now)
+            self._memory_cache.move_to_end(key)
             self._hit_count += 1
             log_cache_operation(self.logger, "hit", key)
             return entry.value
@@ -127,20 +155,31 @@ class CacheManager:
                 self.logger.warning(f"Failed to serialize value for key {key}: {e}")
                 return
 
+            # Don't admit a value that can never fit - it would flush every other entry
+            if size > self.max_size:
+                old_entry = self._memory_cache.pop(key, None)
+                if old_entry is not None:
+                    self._current_size -= old_entry.size
+                self.logger.debug(
+                    f"Not caching key {key}: {size} bytes exceeds max size {self.max_size}"
+                )
+                return
+
             # Check if we need to evict entries
             await self._ensure_space(size)
 
             # Create cache entry
-            entry = CacheEntry(value=value, timestamp=time.time(), ttl=entry_ttl, size=size)
+            entry = CacheEntry(value=value, timestamp=self._now(), ttl=entry_ttl, size=size)
 
             # Remove old entry if exists
-            if key in self._memory_cache:
-                old_entry = self._memory_cache[key]
+            old_entry = self._memory_cache.pop(key, None)
+            if old_entry is not None:
                 self._current_size -= old_entry.size
 
-            # Add new entry
+            # Add new entry as most recently used
             self._memory_cache[key] = entry
             self._current_size += size
+            self._push_expiry(key, entry)
 
             log_cache_operation(self.logger, "set", key)
 
@@ -167,6 +206,7 @@ class CacheManager:
         """Clear all cache entries."""
         async with self._lock:
             self._memory_cache.clear()
+            self._expiry_heap.clear()
             self._current_size = 0
             self.logger.info("Cache cleared")
 
@@ -195,22 +235,37 @@ class CacheManager:
             Number of entries removed
         """
         async with self._lock:
-            expired_keys = []
-            current_time = time.time()
+            expired_count = 0
+            current_time = self._now()
 
-            for key, entry in self._memory_cache.items():
-                if current_time - entry.timestamp > entry.ttl:
-                    expired_keys.append(key)
+            # Only entries whose deadline has passed are popped, the rest stay untouched
+            while self._expiry_heap and self._expiry_heap[0][0] < current_time:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                entry = self._memory_cache.get(key)
+
+                # Skip items for keys that were deleted, evicted or overwritten since
+                if entry is None or entry.timestamp + entry.ttl != expires_at:
+                    continue
 
-            for key in expired_keys:
-                entry = self._memory_cache[key]
                 del self._memory_cache[key]
                 self._current_size -= entry.size
+                expired_count += 1
+
+            if expired_count:
+                self.logger.info(f"Cleaned up {expired_count} expired cache entries")
 
-            if expired_keys:
-                self.logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+            return expired_count
 
-            return len(expired_keys)
+    def _push_expiry(self, key: str, entry: CacheEntry) -> None:
+        """Track an entry's expiry deadline, compacting stale heap items when needed."""
+        heapq.heappush(self._expiry_heap, (entry.timestamp + entry.ttl, key))
+
+        if len(self._expiry_heap) > 2 * len(self._memory_cache) + 64:
+            self._expiry_heap = [
+                (cached.timestamp + cached.ttl, cached_key)
+                for cached_key, cached in self._memory_cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
 
     async def save_to_disk(self) -> None:
         """Save cache to disk."""
@@ -220,11 +275,12 @@ class CacheManager:
         try:
             async with self._lock:
                 # Convert cache to serializable format
+                now = self._now()
                 cache_data = {
                     "entries": {
-                        key: asdict(entry)
+                        key: entry.to_dict()
                         for key, entry in self._memory_cache.items()
-                        if not entry.is_expired()
+                        if not entry.is_expired(now)
                     },
                     "stats": {
                         "access_count": self._access_count,
@@ -232,21 +288,9 @@ class CacheManager:
                     },
                 }
 
-            # Write to temporary file first, then rename for atomicity
-            temp_file = self.cache_file.with_suffix(".tmp")
-
-            # Clean up any existing temp file first
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except OSError:
-                    pass  # Ignore cleanup failures
-
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-
-            # Cross-platform atomic file replacement
-            self._atomic_replace(temp_file, self.cache_file)
+            # Serialize and write off the event loop so shutdown can overlap other teardown
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_cache_file, cache_data)
 
             self.logger.debug("Cache saved to disk")
 
@@ -260,10 +304,32 @@ class CacheManager:
                 except OSError:
                     pass
 
+    def _write_cache_file(self, cache_data: Dict[str, Any]) -> None:
+        """Write cache data to disk via a temporary file."""
+        # Write to temporary file first, then rename for atomicity
+        temp_file = self.cache_file.with_suffix(".tmp")
+
+        # Clean up any existing temp file first
+        if temp_file.exists():
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass  # Ignore cleanup failures
+
+        # orjson writes compact UTF-8 directly, keeping the file small and quick to reload
+        with open(temp_file, "wb") as f:
+            f.write(orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS))
+
+        # Cross-platform atomic file replacement
+        self._atomic_replace(temp_file, self.cache_file)
+
+    def _read_cache_file(self) -> Any:
+        """Read cache data from disk."""
+        with open(self.cache_file, "rb") as f:
+            return orjson.loads(f.read())
+
     def _atomic_replace(self, temp_file: Path, target_file: Path) -> None:
         """Atomically replace target file with temp file, handling Windows limitations."""
-        import platform
-
         if platform.system() == "Windows":
             # Windows doesn't support atomic rename over existing files
             # Use a backup approach to minimize the window of corruption
@@ -301,15 +367,17 @@ class CacheManager:
             return
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            loop = asyncio.get_running_loop()
+            cache_data = await loop.run_in_executor(None, self._read_cache_file)
 
             # Restore cache entries
+            now = self._now()
             for key, entry_data in cache_data.get("entries", {}).items():
                 entry = CacheEntry(**entry_data)
-                if not entry.is_expired():
+                if not entry.is_expired(now):
                     self._memory_cache[key] = entry
                     self._current_size += entry.size
+                    self._push_expiry(key, entry)
 
             # Restore stats
             stats = cache_data.get("stats", {})
@@ -332,22 +400,16 @@ class CacheManager:
         if self._current_size + needed_size <= self.max_size:
             return
 
-        # Sort entries by last access time (LRU first)
-        entries_by_access = sorted(self._memory_cache.items(), key=lambda item: item[1].last_access)
-
         freed_space = 0
         evicted_count = 0
 
-        for key, entry in entries_by_access:
-            if self._current_size + needed_size - freed_space <= self.max_size:
-                break
-
-            del self._memory_cache[key]
+        # Entries are kept in LRU order, so victims come off the front
+        while self._memory_cache and self._current_size + needed_size > self.max_size:
+            _, entry = self._memory_cache.popitem(last=False)
+            self._current_size -= entry.size
             freed_space += entry.size
             evicted_count += 1
 
-        self._current_size -= freed_space
-
         if evicted_count > 0:
             self.logger.info(
                 f"Evicted {evicted_count} LRU cache entries to free {freed_space} bytes"
@@ -366,11 +428,11 @@ class CacheManager:
             *args: Arguments to create key from
 
         Returns:
-            Cache key string (full SHA256 hash for security)
+            Cache key string (256-bit BLAKE2b hash for security)
         """
-        # Create a hash of the arguments - use full hash to prevent collisions
+        # Create a hash of the arguments - keep a full 256-bit digest to prevent collisions
         key_data = str(args).encode("utf-8")
-        return hashlib.sha256(key_data).hexdigest()
+        return hashlib.blake2b(key_data, digest_size=32).hexdigest()
 
     async def get_health_status(self) -> Dict[str, Any]:
         """Get cache health status."""
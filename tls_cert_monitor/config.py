@@ -2,8 +2,11 @@
 Configuration management for TLS Certificate Monitor.
 """
 
+import functools
+import ipaddress
 import logging
 import os
+import platform
 import re
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -11,6 +14,29 @@ from typing import Any, Callable, Dict, List, Optional
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+# Prefer the libyaml C bindings; PyYAML built without libyaml falls back to pure Python
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Duration strings such as "30s", "5m", "1h" or "1d"
+_DURATION_RE = re.compile(r"^(\d+)([smhd])$")
+_DURATION_MULTIPLIERS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_duration(duration: str) -> int:
+    """Parse a duration string to seconds; configs reuse a handful of values."""
+    match = _DURATION_RE.match(duration)
+    if not match:
+        raise ValueError(f"Invalid duration format: {duration}")
+
+    value, unit = match.groups()
+    return int(value) * _DURATION_MULTIPLIERS[unit]
+
 
 class Config(BaseModel):
     """Configuration model for TLS Certificate Monitor."""
@@ -45,16 +71,19 @@ class Config(BaseModel):
     # Logging
     log_level: str = Field(default="INFO")
     log_file: Optional[str] = None
+    access_log: bool = Field(default=False)
 
     # Operation modes
     dry_run: bool = Field(default=False)
     hot_reload: bool = Field(default=True)
+    hot_reload_debounce: str = Field(default="2s")  # Quiet period before reacting to changes
 
     # Cache settings
     cache_type: str = Field(default="memory")  # "memory", "file", or "both"
     cache_dir: str = Field(default="./cache")
     cache_ttl: str = Field(default="1h")
     cache_max_size: int = Field(default=10485760)  # 10MB for memory default
+    metrics_cache_ttl: str = Field(default="5s")  # Reuse rendered /metrics output, "0s" disables
 
     # Security settings
     allowed_ips: List[str] = Field(default_factory=lambda: ["127.0.0.1", "::1"])
@@ -163,8 +192,6 @@ class Config(BaseModel):
     @classmethod
     def validate_allowed_ips(cls, v: List[str]) -> List[str]:
         """Validate IP addresses and CIDR blocks in allowed_ips list."""
-        import ipaddress
-
         validated_ips = []
         for ip_str in v:
             try:
@@ -188,7 +215,7 @@ class Config(BaseModel):
 
         return validated_ips
 
-    @field_validator("scan_interval", "cache_ttl")
+    @field_validator("scan_interval", "cache_ttl", "metrics_cache_ttl", "hot_reload_debounce")
     @classmethod
     def validate_duration(cls, v: str) -> str:
         """Validate duration format (e.g., '5m', '1h', '30s')."""
@@ -196,24 +223,13 @@ class Config(BaseModel):
             raise ValueError("Duration cannot be empty")
 
         # Simple validation for duration format
-        # Use raw string to avoid escaping issues
-        pattern = r"^\d+[smhd]$"
-        if not re.match(pattern, v):
+        if not _DURATION_RE.match(v):
             raise ValueError("Duration must be in format like '5m', '1h', '30s', '1d'")
         return v
 
     def parse_duration_seconds(self, duration: str) -> int:
         """Parse duration string to seconds."""
-        match = re.match(r"^(\d+)([smhd])$", duration)
-        if not match:
-            raise ValueError(f"Invalid duration format: {duration}")
-
-        value, unit = match.groups()
-        value = int(value)
-
-        multipliers = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-
-        return value * multipliers[unit]
+        return _parse_duration(duration)
 
     @property
     def scan_interval_seconds(self) -> int:
@@ -225,6 +241,16 @@ class Config(BaseModel):
         """Get cache TTL in seconds."""
         return self.parse_duration_seconds(self.cache_ttl)
 
+    @property
+    def hot_reload_debounce_seconds(self) -> int:
+        """Get hot reload debounce delay in seconds."""
+        return self.parse_duration_seconds(self.hot_reload_debounce)
+
+    @property
+    def metrics_cache_ttl_seconds(self) -> int:
+        """Get metrics response cache TTL in seconds."""
+        return self.parse_duration_seconds(self.metrics_cache_ttl)
+
 
 def load_config(config_path: Optional[str] = None) -> Config:
     """
@@ -251,7 +277,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
         config_file = Path(config_path)
         if config_file.exists():
             with open(config_file, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
+                config_data = yaml.load(f, Loader=_YamlLoader) or {}  # nosec B506
         else:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
@@ -269,8 +295,6 @@ def _find_default_config() -> Optional[str]:
     Returns:
         Path to config file if found, None otherwise
     """
-    import platform
-
     system = platform.system()
 
     # Define search paths based on platform
@@ -309,12 +333,15 @@ def _get_env_overrides() -> dict:
         "TLS_MONITOR_WORKERS": ("workers", int),
         "TLS_MONITOR_LOG_LEVEL": ("log_level", str),
         "TLS_MONITOR_LOG_FILE": ("log_file", str),
+        "TLS_MONITOR_ACCESS_LOG": ("access_log", lambda x: x.lower() in ("true", "1", "yes")),
         "TLS_MONITOR_DRY_RUN": ("dry_run", lambda x: x.lower() in ("true", "1", "yes")),
         "TLS_MONITOR_HOT_RELOAD": ("hot_reload", lambda x: x.lower() in ("true", "1", "yes")),
+        "TLS_MONITOR_HOT_RELOAD_DEBOUNCE": ("hot_reload_debounce", str),
         "TLS_MONITOR_CACHE_TYPE": ("cache_type", str),
         "TLS_MONITOR_CACHE_DIR": ("cache_dir", str),
         "TLS_MONITOR_CACHE_TTL": ("cache_ttl", str),
         "TLS_MONITOR_CACHE_MAX_SIZE": ("cache_max_size", int),
+        "TLS_MONITOR_METRICS_CACHE_TTL": ("metrics_cache_ttl", str),
         "TLS_MONITOR_ENABLE_IP_WHITELIST": (
             "enable_ip_whitelist",
             lambda x: x.lower() in ("true", "1", "yes"),
@@ -367,15 +394,18 @@ def create_example_config(output_path: str = "config.example.yaml") -> None:
         "scan_interval": "5m",
         "workers": 4,
         "log_level": "INFO",
+        "access_log": False,
         "dry_run": False,
         "hot_reload": True,
+        "hot_reload_debounce": "2s",
         "cache_type": "memory",
         "cache_dir": "./cache",
         "cache_ttl": "1h",
         "cache_max_size": 10485760,  # 10MB for memory, 30MB (31457280) for file
+        "metrics_cache_ttl": "5s",
         "allowed_ips": ["127.0.0.1", "::1", "192.168.1.0/24"],  # localhost + local network
         "enable_ip_whitelist": True,
     }
 
     with open(output_path, "w", encoding="utf-8") as f:
-        yaml.dump(example_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(example_config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
@@ -3,8 +3,9 @@ Hot reload functionality for TLS Certificate Monitor.
 """
 
 import asyncio
+from functools import partial
 from pathlib import Path
-from typing import Any, Coroutine, Optional, Set
+from typing import Any, Coroutine, Dict, Optional, Set
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
@@ -89,11 +90,17 @@ class HotReloadManager:
     """
 
     def __init__(
-        self, config: Config, scanner: CertificateScanner, config_path: Optional[str] = None
+        self,
+        config: Config,
+        scanner: CertificateScanner,
+        config_path: Optional[str] = None,
+        debounce_delay: float = 2.0,
     ):
         self.config = config
         self.scanner = scanner
         self.config_path = Path(config_path) if config_path else None
+        # Quiet period that coalesces the burst of events editors emit per save
+        self.debounce_delay = debounce_delay
         self.logger = get_logger("hot_reload")
 
         self._observer = Observer()
@@ -105,8 +112,8 @@ class HotReloadManager:
         self._cert_handler = CertificateFileHandler(self)
         self._config_handler = ConfigFileHandler(self)
 
-        # Debouncing for rapid file changes
-        self._cert_change_tasks: Set[asyncio.Task] = set()
+        # Debouncing for rapid file changes - one pending task per certificate path
+        self._cert_change_tasks: Dict[str, asyncio.Task] = {}
         self._config_change_task: Optional[asyncio.Task] = None
 
         self.logger.info("Hot reload manager initialized")
@@ -132,25 +139,9 @@ class HotReloadManager:
         self._event_loop = asyncio.get_running_loop()
 
         try:
-            # Watch configuration file
-            if self.config_path and self.config_path.exists():
-                config_dir = self.config_path.parent
-                self._observer.schedule(self._config_handler, str(config_dir), recursive=False)
-                self._watched_paths.add(str(config_dir))
-                self.logger.info(f"Watching configuration file: {self.config_path}")
-
-            # Watch certificate directories
-            for cert_dir in self.config.certificate_directories:
-                cert_path = Path(cert_dir)
-                if cert_path.exists() and cert_path.is_dir():
-                    self._observer.schedule(self._cert_handler, str(cert_path), recursive=True)
-                    self._watched_paths.add(str(cert_path))
-                    self.logger.info(f"Watching certificate directory: {cert_path}")
-                else:
-                    self.logger.warning(f"Certificate directory does not exist: {cert_dir}")
-
-            # Start observer
-            self._observer.start()
+            # Starting the observer walks each watched tree to add its watches; do it
+            # off the event loop so the first scan can proceed meanwhile
+            await self._event_loop.run_in_executor(None, self._start_observer)
             self._watching = True
 
             self.logger.info(f"Hot reload started - Watching {len(self._watched_paths)} paths")
@@ -159,6 +150,28 @@ class HotReloadManager:
             self.logger.error(f"Failed to start hot reload: {e}")
             raise
 
+    def _start_observer(self) -> None:
+        """Schedule watches and start the observer thread."""
+        # Watch configuration file
+        if self.config_path and self.config_path.exists():
+            config_dir = self.config_path.parent
+            self._observer.schedule(self._config_handler, str(config_dir), recursive=False)
+            self._watched_paths.add(str(config_dir))
+            self.logger.info(f"Watching configuration file: {self.config_path}")
+
+        # Watch certificate directories
+        for cert_dir in self.config.certificate_directories:
+            cert_path = Path(cert_dir)
+            if cert_path.exists() and cert_path.is_dir():
+                self._observer.schedule(self._cert_handler, str(cert_path), recursive=True)
+                self._watched_paths.add(str(cert_path))
+                self.logger.info(f"Watching certificate directory: {cert_path}")
+            else:
+                self.logger.warning(f"Certificate directory does not exist: {cert_dir}")
+
+        # Start observer
+        self._observer.start()
+
     async def stop(self) -> None:
         """Stop hot reload monitoring."""
         if not self._watching:
@@ -166,10 +179,12 @@ class HotReloadManager:
 
         try:
             self._observer.stop()
-            self._observer.join(timeout=5.0)
+            # Joining the observer thread blocks; wait for it in a worker thread
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._observer.join, 5.0)
 
             # Cancel pending tasks
-            for task in self._cert_change_tasks:
+            for task in self._cert_change_tasks.values():
                 task.cancel()
 
             if self._config_change_task:
@@ -193,25 +208,23 @@ class HotReloadManager:
         """
         try:
             # Cancel any existing task for this file
-            tasks_to_remove = set()
-            for task in self._cert_change_tasks:
-                if not task.done() and hasattr(task, "_file_path") and task._file_path == file_path:
-                    task.cancel()
-                    tasks_to_remove.add(task)
-
-            self._cert_change_tasks -= tasks_to_remove
+            pending = self._cert_change_tasks.get(file_path)
+            if pending is not None and not pending.done():
+                pending.cancel()
 
-            # Create new debounced task
+            # Create new debounced task, removed from the map once it finishes
             task = asyncio.create_task(self._debounced_cert_change(file_path, event_type))
-            task._file_path = file_path  # type: ignore[attr-defined] # Store file path for cancellation
-            self._cert_change_tasks.add(task)
-
-            # Clean up completed tasks
-            self._cert_change_tasks = {t for t in self._cert_change_tasks if not t.done()}
+            self._cert_change_tasks[file_path] = task
+            task.add_done_callback(partial(self._discard_cert_task, file_path))
 
         except Exception as e:
             self.logger.error(f"Error handling certificate change for {file_path}: {e}")
 
+    def _discard_cert_task(self, file_path: str, task: asyncio.Task) -> None:
+        """Forget a finished certificate task unless a newer one replaced it."""
+        if self._cert_change_tasks.get(file_path) is task:
+            del self._cert_change_tasks[file_path]
+
     async def _debounced_cert_change(self, file_path: str, event_type: str) -> None:
         """
         Debounced certificate change handler.
@@ -221,8 +234,8 @@ class HotReloadManager:
             event_type: Type of file system event
         """
         try:
-            # Increased debounce period to catch rapid successive writes
-            await asyncio.sleep(2.0)
+            # Debounce period long enough to catch rapid successive writes
+            await asyncio.sleep(self.debounce_delay)
 
             # Verify file still exists and has stabilized (for non-delete events)
             file_path_obj = Path(file_path)
@@ -279,7 +292,7 @@ class HotReloadManager:
         """Debounced configuration change handler."""
         try:
             # Wait for debounce period
-            await asyncio.sleep(2.0)
+            await asyncio.sleep(self.debounce_delay)
 
             self.logger.info("Reloading configuration due to file change")
 
@@ -313,6 +326,7 @@ class HotReloadManager:
             old_config = self.config
             self.config = new_config
             self.scanner.config = new_config
+            self.debounce_delay = new_config.hot_reload_debounce_seconds
 
             # Update watched directories if needed
             if dirs_added or dirs_removed:
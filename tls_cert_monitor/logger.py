@@ -2,15 +2,41 @@
 Standardized logging configuration for TLS Certificate Monitor.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+import orjson
 
 from tls_cert_monitor.config import Config
 
 
+class _ListenerState:
+    """Holds the background listener that writes queued records to the real handlers."""
+
+    listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for an in-process queue that keeps exception info intact."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message now, but leave exc_info for the formatters."""
+        # The stock prepare() also flattens the traceback into msg for pickling, which
+        # an in-process queue doesn't need and which hides it from the formatters.
+        # Args are still merged here so the line shows their state at call time.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class CustomFormatter(logging.Formatter):
     """Custom formatter with colored output for console."""
 
@@ -61,9 +87,6 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        import json
-        from datetime import datetime
-
         log_data = {
             "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
@@ -86,7 +109,7 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return orjson.dumps(log_data, default=str).decode("utf-8")
 
 
 def setup_logging(config: Config) -> None:
@@ -100,8 +123,12 @@ def setup_logging(config: Config) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, config.log_level))
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    # Stop a listener left by a previous call, then detach and close existing handlers
+    stop_logging()
+    for existing_handler in root_logger.handlers[:]:
+        root_logger.removeHandler(existing_handler)
+        existing_handler.close()
+    handlers: List[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -111,7 +138,7 @@ def setup_logging(config: Config) -> None:
     use_color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
     console_formatter = CustomFormatter(use_color=use_color)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler if log file is specified
     if config.log_file:
@@ -127,7 +154,15 @@ def setup_logging(config: Config) -> None:
         # Use structured formatter for file logging
         file_formatter = StructuredFormatter()
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Log calls only enqueue the record; stdout and file writes happen on the
+    # listener thread so they never block the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _ListenerState.listener = listener
 
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -141,6 +176,24 @@ def setup_logging(config: Config) -> None:
         app_logger.info(f"Log file: {config.log_file}")
 
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    listener = _ListenerState.listener
+    if listener is None:
+        return
+
+    _ListenerState.listener = None
+    listener.stop()
+
+    # Release the console and rotating file handlers the listener owned
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Flush records still queued when the interpreter exits
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance.
@@ -2,7 +2,9 @@
 Prometheus metrics collection for TLS Certificate Monitor.
 """
 
+import re
 import socket
+import sys
 import time
 from collections import defaultdict
 from typing import Any, Dict, List, Type, Union
@@ -17,6 +19,7 @@ from prometheus_client import (
     generate_latest,
 )
 
+from tls_cert_monitor import __version__
 from tls_cert_monitor.logger import get_logger, log_metrics_collection
 
 
@@ -341,10 +344,6 @@ class MetricsCollector:
             self.app_thread_count.set(int(thread_count))
 
             # Application info (only set once)
-            import sys
-
-            from tls_cert_monitor import __version__
-
             self.app_info.labels(
                 hostname=socket.gethostname(),
                 version=__version__,
@@ -514,8 +513,6 @@ class MetricsCollector:
         Returns:
             Formatted metrics text with integers instead of scientific notation/decimals
         """
-        import re
-
         lines = metrics_text.split("\n")
         formatted_lines = []
 
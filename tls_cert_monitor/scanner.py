@@ -53,9 +53,16 @@ class CertificateScanner:
         self._scan_task: Optional[asyncio.Task] = None
         self._executor = ThreadPoolExecutor(max_workers=config.workers)
         self._scan_lock: Optional[asyncio.Lock] = None  # Initialize lock lazily in async context
+        self._scan_generation = 0
+
 
         self.logger.info(f"Certificate scanner initialized - Workers: {config.workers}")
 
+    @property
+    def scan_generation(self) -> int:
+        """Number of completed scans; changes whenever fresh results are published."""
+        return self._scan_generation
+
     async def start_scanning(self) -> None:
         """Start the periodic certificate scanning."""
         if self._scanning:
@@ -77,7 +84,9 @@ class CertificateScanner:
             except asyncio.CancelledError:
                 pass
 
-        self._executor.shutdown(wait=True)
+        # Waiting for in-flight parses blocks; do it in a worker thread
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
         self.logger.info("Certificate scanner stopped")
 
     async def scan_once(self) -> Dict[str, Any]:
@@ -162,6 +171,9 @@ class CertificateScanner:
                 f"Files: {total_files}, Parsed: {total_parsed}, Errors: {total_errors}"
             )
 
+            # Lets views derived from the metrics (the /metrics body cache) spot new results
+            self._scan_generation += 1
+
             return scan_results
 
     async def _scan_loop(self) -> None: